@@ -0,0 +1,143 @@
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import multiprocessing
+import resource
+import sys
+import time
+import timeit
+
+from twitter_py import Twitter
+from twitter_py import timeline
+from twitter_py.models import Tweet, User, TweetView, UserView
+from twitter_py.exceptions import RateLimited, TransientError
+
+from benchmarks import mock_server
+
+
+DISTINCT_IDS = 50
+
+SCENARIOS = {
+    "get_tweet_info": lambda tw, i: tw.get_tweet_info(1700000000000000000 + i % DISTINCT_IDS * 100),
+    "get_user_tweets": lambda tw, i: tw.get_user_tweets(44196397 + i % DISTINCT_IDS),
+    "get_user_followers": lambda tw, i: tw.get_user_followers(44196397 + i % DISTINCT_IDS),
+    "get_user_info": lambda tw, i: tw.get_user_info(f"user{i % DISTINCT_IDS}"),
+    "get_space_info": lambda tw, i: tw.get_space_info(f"1Ynxo{i % DISTINCT_IDS}"),
+    "iter_user_followers": lambda tw, i: _drain(tw.iter_user_followers(44196397 + i % DISTINCT_IDS, page_size=100)),
+    "get_user_tweets lazy": lambda tw, i: tw.get_user_tweets(44196397 + i % DISTINCT_IDS, lazy=True)
+}
+
+
+async def _drain(items) -> int:
+    count = 0
+    async for _ in items:
+        count += 1
+    return count
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(samples: list[float], q: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+async def run_scenario(name: str, requests: int, concurrency: int, **server_options) -> dict:
+    server = mock_server.MockXServer(**server_options)
+    latencies = []
+    failures = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    async with Twitter(transport=server.transport) as tw:
+        call = SCENARIOS[name]
+
+        async def one(i):
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await call(tw, i)
+                except (RateLimited, TransientError):
+                    failures += 1
+                else:
+                    latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(call(tw, i) for i in range(DISTINCT_IDS)), return_exceptions=True)
+        server.requests = server.rate_limited = 0
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+    return {
+        "scenario": name,
+        "calls": requests,
+        "http_requests": server.requests,
+        "rate_limited": server.rate_limited,
+        "failed": failures,
+        "calls_per_sec": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def run_isolated(name: str, requests: int, concurrency: int, **server_options) -> dict:
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_run_scenario, name, requests, concurrency, server_options).result()
+
+
+def _run_scenario(name: str, requests: int, concurrency: int, server_options: dict) -> dict:
+    return asyncio.run(run_scenario(name, requests, concurrency, **server_options))
+
+
+def _ms(value: float | None) -> str:
+    return f"{value:>10.2f}" if value is not None else f"{'-':>10}"
+
+
+def parse_costs(number: int = 20) -> dict[str, float]:
+    tweets = json.loads(json.dumps(mock_server.user_tweets(44196397, 100, 0, 2)))["data"]["user"]["result"]["timeline_v2"]["timeline"]["instructions"]
+    users = json.loads(json.dumps(mock_server.followers(44196397, 100, 0, 2)))["data"]["user"]["result"]["timeline"]["timeline"]["instructions"]
+    costs = {}
+    for label, instructions, parse, kind in (
+        ("Tweet", tweets, Tweet.model_validate, timeline.TWEET),
+        ("TweetView", tweets, TweetView, timeline.TWEET),
+        ("User", users, User.model_validate, timeline.USER),
+        ("UserView", users, UserView, timeline.USER)
+    ):
+        items, _ = Twitter._read_timeline(instructions, parse, kind)
+        seconds = min(timeit.repeat(lambda: Twitter._read_timeline(instructions, parse, kind), number=number, repeat=5))
+        costs[label] = seconds / number / len(items) * 1e6
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--rate-limit-reset", type=float, default=0.05)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.scenario or SCENARIOS:
+        results.append(run_isolated(name, args.requests, args.concurrency, latency=args.latency, jitter=args.jitter, rate_limit_every=args.rate_limit_every, rate_limit_reset=args.rate_limit_reset))
+    costs = parse_costs()
+    if args.json:
+        print(json.dumps({"scenarios": results, "parse_us_per_item": costs}, indent=2))
+        return
+    print(f"{'scenario':<24}{'calls/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'http':>8}{'429s':>6}{'failed':>8}{'rss MB':>9}")
+    for result in results:
+        print(f"{result['scenario']:<24}{result['calls_per_sec']:>10.1f}{_ms(result['p50_ms'])}{_ms(result['p99_ms'])}{result['http_requests']:>8}{result['rate_limited']:>6}{result['failed']:>8}{result['peak_rss_mb']:>9.1f}")
+    print()
+    for label, cost in costs.items():
+        print(f"{label:<24}{cost:>10.2f} us/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import timeit
+
+from pydantic import BaseModel
+
+from twitter_py.models import Tweet, User, TweetView
+
+
+class FlatTweet(BaseModel):
+    id: str = None
+    card_id: str = None
+    bookmark_count: int = None
+    like_count: int = None
+    reply_count: int = None
+    retweet_count: int = None
+    quote_count: int = None
+    views_count: int = None
+
+
+class FlatUser(BaseModel):
+    id: str
+    name: str
+    username: str
+    followers_count: int
+    following_count: int
+
+
+USER = {
+    "__typename": "User",
+    "rest_id": "44196397",
+    "legacy": {
+        "name": "Elon Musk",
+        "screen_name": "elonmusk",
+        "followers_count": 190000000,
+        "friends_count": 800,
+        "description": "",
+        "location": "",
+        "statuses_count": 40000
+    }
+}
+
+LEGACY = {
+    "bookmark_count": 1200,
+    "favorite_count": 54000,
+    "reply_count": 3100,
+    "retweet_count": 8700,
+    "quote_count": 450,
+    "full_text": "Hello world",
+    "lang": "en",
+    "user_id_str": "44196397"
+}
+
+TWEET = {
+    "__typename": "Tweet",
+    "rest_id": "1780000000000000000",
+    "core": {"user_results": {"result": USER}},
+    "card": {"rest_id": "card://1780000000000000001"},
+    "legacy": LEGACY,
+    "views": {"count": "2500000", "state": "EnabledWithCount"}
+}
+
+SHAPES = {
+    "plain": TWEET,
+    "visibility": {"__typename": "TweetWithVisibilityResults", "tweet": TWEET, "limitedActionResults": {}},
+    "retweet": {**TWEET, "legacy": {**LEGACY, "retweeted_status_result": {"result": TWEET}}}
+}
+
+
+def _touch(view: TweetView):
+    return view.id, view.like_count
+
+
+def bench(name: str, func: callable, number: int = 50000):
+    seconds = min(timeit.repeat(func, number=number, repeat=7))
+    print(f"{name:<40} {seconds / number * 1e6:8.2f} us")
+
+
+def main():
+    for shape, result in SHAPES.items():
+        bench(f"Tweet(**result) [{shape}]", lambda: Tweet(**result))
+        bench(f"Tweet.model_validate [{shape}]", lambda: Tweet.model_validate(result))
+        bench(f"TweetView id+like_count [{shape}]", lambda: _touch(TweetView(result)))
+    flat_tweet = Tweet(**TWEET).model_dump()
+    bench("FlatTweet.model_validate [no aliases]", lambda: FlatTweet.model_validate(flat_tweet))
+    bench("User(**result)", lambda: User(**USER))
+    flat_user = User(**USER).model_dump()
+    bench("FlatUser.model_validate [no aliases]", lambda: FlatUser.model_validate(flat_user))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import twitter_py; print(time.perf_counter() - start)"
+FIRST_CONSTRUCT_SNIPPET = "import twitter_py, time; start = time.perf_counter(); twitter_py.Twitter(); print(time.perf_counter() - start)"
+
+
+def subprocess_seconds(snippet: str, runs: int) -> list[float]:
+    return [float(subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True, check=True).stdout.split()[-1]) for _ in range(runs)]
+
+
+def report(label: str, samples: list[float]):
+    print(f"{label:<40}{statistics.median(samples) * 1000:>10.2f} ms  (min {min(samples) * 1000:.2f})")
+
+
+def main():
+    report("import twitter_py (cold process)", subprocess_seconds(IMPORT_SNIPPET, 10))
+    report("first Twitter() in process", subprocess_seconds(FIRST_CONSTRUCT_SNIPPET, 10))
+
+    from twitter_py import Twitter
+    Twitter()
+    number = 200
+    for label, construct in (
+        ("Twitter() warm", lambda: Twitter()),
+        ("Twitter(user_agent=...) warm", lambda: Twitter(user_agent="Mozilla/5.0")),
+    ):
+        samples = [seconds / number for seconds in timeit.repeat(construct, number=number, repeat=5)]
+        report(label, samples)
+
+    tw = Twitter(user_agent="Mozilla/5.0")
+    start = time.perf_counter()
+    tw._public_client
+    report("first client creation", [time.perf_counter() - start])
+
+
+if __name__ == "__main__":
+    main()
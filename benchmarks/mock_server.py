@@ -0,0 +1,199 @@
+import asyncio
+import json
+import random
+import re
+import time
+from urllib.parse import parse_qsl
+
+import httpx
+
+
+def user_result(user_id: int) -> dict:
+    return {
+        "__typename": "User",
+        "id": f"VXNlcjo{user_id}",
+        "rest_id": str(user_id),
+        "affiliates_highlighted_label": {},
+        "has_graduated_access": True,
+        "is_blue_verified": user_id % 3 == 0,
+        "profile_image_shape": "Circle",
+        "legacy": {
+            "can_dm": False,
+            "can_media_tag": True,
+            "created_at": "Tue Jun 02 20:12:29 +0000 2009",
+            "default_profile": False,
+            "default_profile_image": False,
+            "description": "Building things on the internet. Opinions are my own, retweets are not endorsements.",
+            "entities": {"description": {"urls": []}, "url": {"urls": [{"display_url": "example.com", "expanded_url": "https://example.com", "url": "https://t.co/abcdefghij", "indices": [0, 23]}]}},
+            "fast_followers_count": 0,
+            "favourites_count": user_id % 50000,
+            "followers_count": user_id % 1000000,
+            "friends_count": user_id % 5000,
+            "has_custom_timelines": True,
+            "is_translator": False,
+            "listed_count": user_id % 1000,
+            "location": "Earth",
+            "media_count": user_id % 3000,
+            "name": f"User {user_id}",
+            "normal_followers_count": user_id % 1000000,
+            "pinned_tweet_ids_str": [],
+            "possibly_sensitive": False,
+            "profile_banner_url": f"https://pbs.twimg.com/profile_banners/{user_id}/1690000000",
+            "profile_image_url_https": f"https://pbs.twimg.com/profile_images/{user_id}/avatar_normal.jpg",
+            "profile_interstitial_type": "",
+            "screen_name": f"user{user_id}",
+            "statuses_count": user_id % 100000,
+            "translator_type": "none",
+            "url": "https://t.co/abcdefghij",
+            "verified": False,
+            "withheld_in_countries": []
+        },
+        "professional": {"rest_id": str(user_id * 7), "professional_type": "Creator", "category": []},
+        "verification_info": {}
+    }
+
+
+def tweet_result(tweet_id: int, author_id: int = 44196397) -> dict:
+    result = {
+        "__typename": "Tweet",
+        "rest_id": str(tweet_id),
+        "core": {"user_results": {"result": user_result(author_id)}},
+        "unmention_data": {},
+        "edit_control": {"edit_tweet_ids": [str(tweet_id)], "editable_until_msecs": "1700000000000", "is_edit_eligible": True, "edits_remaining": "5"},
+        "is_translatable": False,
+        "views": {"count": str(tweet_id % 10000000), "state": "EnabledWithCount"},
+        "source": "<a href=\"https://mobile.twitter.com\" rel=\"nofollow\">Twitter Web App</a>",
+        "legacy": {
+            "bookmark_count": tweet_id % 1000,
+            "bookmarked": False,
+            "created_at": "Wed Oct 10 20:19:24 +0000 2018",
+            "conversation_id_str": str(tweet_id),
+            "display_text_range": [0, 140],
+            "entities": {"hashtags": [{"indices": [120, 130], "text": "benchmark"}], "symbols": [], "timestamps": [], "urls": [], "user_mentions": []},
+            "favorite_count": tweet_id % 100000,
+            "favorited": False,
+            "full_text": "This is a representative tweet body used for offline benchmarking of the timeline parsers. #benchmark",
+            "is_quote_status": False,
+            "lang": "en",
+            "quote_count": tweet_id % 100,
+            "reply_count": tweet_id % 500,
+            "retweet_count": tweet_id % 10000,
+            "retweeted": False,
+            "user_id_str": str(author_id),
+            "id_str": str(tweet_id)
+        }
+    }
+    if tweet_id % 10 == 0:
+        return {"__typename": "TweetWithVisibilityResults", "tweet": result, "limitedActionResults": {"limited_actions": []}}
+    return result
+
+
+def _item(entry_id: str, key: str, result: dict) -> dict:
+    return {"entryId": entry_id, "sortIndex": entry_id.rsplit("-", 1)[-1], "content": {"entryType": "TimelineTimelineItem", "__typename": "TimelineTimelineItem", "itemContent": {"itemType": "TimelineTweet" if key == "tweet_results" else "TimelineUser", key: {"result": result}}}}
+
+
+def _cursor(cursor_type: str, value: str) -> dict:
+    return {"entryId": f"cursor-{cursor_type.lower()}-{value}", "sortIndex": "0", "content": {"entryType": "TimelineTimelineCursor", "__typename": "TimelineTimelineCursor", "value": value, "cursorType": cursor_type}}
+
+
+def timeline(entries: list, page: int, pages: int) -> dict:
+    entries = [*entries, _cursor("Top", f"top-{page}")]
+    if page + 1 < pages:
+        entries.append(_cursor("Bottom", f"page-{page + 1}"))
+    return {"instructions": [{"type": "TimelineClearCache"}, {"type": "TimelineAddEntries", "entries": entries}]}
+
+
+def user_tweets(user_id: int, count: int, page: int, pages: int) -> dict:
+    base = 1800000000000000000 - page * count
+    entries = [_item(f"tweet-{base - i}", "tweet_results", tweet_result(base - i, user_id)) for i in range(count)]
+    return {"data": {"user": {"result": {"__typename": "User", "timeline_v2": {"timeline": timeline(entries, page, pages)}}}}}
+
+
+def followers(user_id: int, count: int, page: int, pages: int) -> dict:
+    base = 1000000 + page * count
+    entries = [_item(f"user-{base + i}", "user_results", user_result(base + i)) for i in range(count)]
+    return {"data": {"user": {"result": {"__typename": "User", "timeline": {"timeline": timeline(entries, page, pages)}}}}}
+
+
+def tweet_detail(tweet_id: int, replies: int = 10) -> dict:
+    entries = [_item(f"tweet-{tweet_id}", "tweet_results", tweet_result(tweet_id))]
+    for i in range(replies):
+        reply_id = tweet_id + i + 1
+        entries.append({"entryId": f"conversationthread-{reply_id}", "sortIndex": str(reply_id), "content": {"entryType": "TimelineTimelineModule", "__typename": "TimelineTimelineModule", "displayType": "VerticalConversation", "items": [
+            {"entryId": f"conversationthread-{reply_id}-tweet-{reply_id}", "item": {"itemContent": {"itemType": "TimelineTweet", "tweet_results": {"result": tweet_result(reply_id, 1000 + i)}}}}
+        ]}})
+    return {"data": {"threaded_conversation_with_injections_v2": timeline(entries, 0, 2)}}
+
+
+def user_by_screen_name(screen_name: str) -> dict:
+    return {"data": {"user": {"result": user_result(int(re.sub(r"\D", "", screen_name) or 44196397))}}}
+
+
+def audio_space(space_id: str, listeners: int = 50) -> dict:
+    return {"data": {"audioSpace": {
+        "metadata": {"rest_id": space_id, "state": "Running", "title": "Benchmark space", "media_key": f"28_{space_id}", "created_at": 1700000000000, "started_at": 1700000000000, "total_live_listeners": listeners, "total_replay_watched": 0, "is_space_available_for_replay": True, "creator_results": {"result": user_result(44196397)}},
+        "participants": {"total": listeners, "admins": [{"user_results": {"rest_id": "44196397", "result": user_result(44196397)}}], "speakers": [], "listeners": [{"user_results": {"rest_id": str(2000 + i), "result": user_result(2000 + i)}} for i in range(listeners)]}
+    }}}
+
+
+class MockXServer:
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, rate_limit_every: int = 0, pages: int = 5, rate_limit: int = 1000000, rate_limit_reset: float = 0.05, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every
+        self.pages = pages
+        self.rate_limit = rate_limit
+        self.rate_limit_reset = rate_limit_reset
+        self.requests = 0
+        self.rate_limited = 0
+        self._random = random.Random(seed)
+        self._bodies = {}
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+    def _payload(self, name: str, variables: dict) -> dict | None:
+        cursor = variables.get("cursor")
+        page = int(cursor.rsplit("-", 1)[-1]) if cursor else 0
+        count = variables.get("count", 20)
+        if name == "UserTweets":
+            return user_tweets(int(variables["userId"]), count, page, self.pages)
+        if name in ("Followers", "Following"):
+            return followers(int(variables["userId"]), count, page, self.pages)
+        if name == "TweetDetail":
+            return tweet_detail(int(variables["focalTweetId"]))
+        if name == "UserByScreenName":
+            return user_by_screen_name(variables["screen_name"])
+        if name == "AudioSpaceById":
+            return audio_space(variables["id"])
+        return None
+
+    def _body(self, name: str, variables: dict) -> bytes | None:
+        key = (name, json.dumps(variables, sort_keys=True))
+        body = self._bodies.get(key)
+        if body is None:
+            payload = self._payload(name, variables)
+            if payload is None:
+                return None
+            body = self._bodies[key] = json.dumps(payload, separators=(",", ":")).encode()
+        return body
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        rate_limited = self.rate_limit_every and self._random.random() * self.rate_limit_every < 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._random.random() * self.jitter)
+        if request.url.path.endswith("/migrate"):
+            return httpx.Response(200, text="<html><script>document.cookie=\"gt=1234567890123456789\"</script></html>")
+        reset = str(int(time.time() + self.rate_limit_reset))
+        if rate_limited and not request.url.path.endswith("/migrate"):
+            self.rate_limited += 1
+            return httpx.Response(429, headers={"x-rate-limit-limit": str(self.rate_limit), "x-rate-limit-remaining": "0", "x-rate-limit-reset": reset})
+        name = request.url.path.rsplit("/", 1)[-1]
+        variables = json.loads(dict(parse_qsl(request.url.query.decode())).get("variables", "{}"))
+        body = self._body(name, variables)
+        if body is None:
+            return httpx.Response(404)
+        headers = {"content-type": "application/json", "x-rate-limit-limit": str(self.rate_limit), "x-rate-limit-remaining": str(self.rate_limit - 1), "x-rate-limit-reset": reset}
+        return httpx.Response(200, headers=headers, content=body)
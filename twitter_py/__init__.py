@@ -1 +1,2 @@
 from twitter_py.twitter import Twitter
+from twitter_py.sync import SyncTwitter
@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+
+DEFAULT_CACHE_TTL = {
+    "UserByScreenName": 300,
+    "UserByRestId": 300,
+    "UsersByRestIds": 300,
+    "UsersByScreenNames": 300,
+    "TweetDetail": 60,
+    "TweetResultByRestId": 60,
+    "AudioSpaceById": 30
+}
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> str | None:
+        ...
+
+    async def set(self, key: str, value: str, ttl: float):
+        ...
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float):
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import sqlite3
+from typing import NamedTuple, Protocol
+
+
+class Checkpoint(NamedTuple):
+    operation: str
+    variables: dict
+    cursor: str | None
+    items_emitted: int
+    page_offset: int = 0
+
+
+def checkpoint_key(operation: str, variables: dict) -> str:
+    return f"{operation}:{json.dumps(variables, sort_keys=True, separators=(',', ':'))}"
+
+
+class CheckpointStore(Protocol):
+    async def load(self, key: str) -> Checkpoint | None:
+        ...
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        ...
+
+    async def delete(self, key: str):
+        ...
+
+
+class MemoryCheckpointStore:
+    def __init__(self):
+        self._checkpoints = {}
+
+    async def load(self, key: str) -> Checkpoint | None:
+        return self._checkpoints.get(key)
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        self._checkpoints[key] = checkpoint
+
+    async def delete(self, key: str):
+        self._checkpoints.pop(key, None)
+
+
+class FileCheckpointStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = asyncio.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, checkpoints: dict):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoints, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _update(self, key: str, checkpoint: Checkpoint | None):
+        checkpoints = self._read()
+        if checkpoint is None:
+            if checkpoints.pop(key, None) is None:
+                return
+        else:
+            checkpoints[key] = checkpoint._asdict()
+        self._write(checkpoints)
+
+    async def load(self, key: str) -> Checkpoint | None:
+        async with self._lock:
+            checkpoint = (await asyncio.to_thread(self._read)).get(key)
+        return Checkpoint(**checkpoint) if checkpoint else None
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        async with self._lock:
+            await asyncio.to_thread(self._update, key, checkpoint)
+
+    async def delete(self, key: str):
+        async with self._lock:
+            await asyncio.to_thread(self._update, key, None)
+
+
+class SQLiteCheckpointStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = asyncio.Lock()
+        self._execute("CREATE TABLE IF NOT EXISTS checkpoints (key TEXT PRIMARY KEY, operation TEXT NOT NULL, variables TEXT NOT NULL, cursor TEXT, items_emitted INTEGER NOT NULL, page_offset INTEGER NOT NULL DEFAULT 0)", ())
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def _execute(self, query: str, parameters: tuple) -> tuple | None:
+        connection = self._connect()
+        try:
+            with connection:
+                return connection.execute(query, parameters).fetchone()
+        finally:
+            connection.close()
+
+    async def load(self, key: str) -> Checkpoint | None:
+        async with self._lock:
+            row = await asyncio.to_thread(self._execute, "SELECT operation, variables, cursor, items_emitted, page_offset FROM checkpoints WHERE key = ?", (key,))
+        if row is None:
+            return None
+        operation, variables, cursor, items_emitted, page_offset = row
+        return Checkpoint(operation, json.loads(variables), cursor, items_emitted, page_offset)
+
+    async def save(self, key: str, checkpoint: Checkpoint):
+        async with self._lock:
+            await asyncio.to_thread(self._execute, "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)", (key, checkpoint.operation, json.dumps(checkpoint.variables), checkpoint.cursor, checkpoint.items_emitted, checkpoint.page_offset))
+
+    async def delete(self, key: str):
+        async with self._lock:
+            await asyncio.to_thread(self._execute, "DELETE FROM checkpoints WHERE key = ?", (key,))
@@ -0,0 +1,49 @@
+import json
+
+
+class JSONCodec:
+    name = "json"
+
+    def loads(self, data: bytes | str):
+        return json.loads(data)
+
+    def dumps(self, value) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str):
+        return self._orjson.loads(data)
+
+    def dumps(self, value) -> str:
+        return self._orjson.dumps(value).decode()
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: bytes | str):
+        return self._decoder.decode(data)
+
+    def dumps(self, value) -> str:
+        return self._encoder.encode(value).decode()
+
+
+def default_codec():
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JSONCodec()
@@ -29,3 +29,13 @@ class InvalidEmail(Exception):
 class CaptchaFailed(Exception):
     def __init__(self):
         super().__init__("Captcha failed.")
+
+class RateLimited(Exception):
+    def __init__(self, reset: float = None):
+        super().__init__("Rate limited.")
+        self.reset = reset
+
+class TransientError(Exception):
+    def __init__(self, reset: float = None):
+        super().__init__("Transient error.")
+        self.reset = reset
@@ -0,0 +1,132 @@
+import gzip
+import json
+from array import array
+
+
+MISSING = -1
+
+
+class ColumnBatch:
+    int_fields = ()
+    str_fields = ()
+    nullable = ()
+
+    def __init__(self):
+        self._ints = {name: array("q") for name in self.int_fields}
+        self._strs = {name: (bytearray(), array("q", [0])) for name in self.str_fields}
+        self._len = 0
+        self._exported = False
+
+    def __len__(self):
+        return self._len
+
+    def _detach(self):
+        self._ints = {name: array("q", column) for name, column in self._ints.items()}
+        self._strs = {name: (bytearray(data), array("q", offsets)) for name, (data, offsets) in self._strs.items()}
+        self._exported = False
+
+    def append(self, item):
+        if self._exported:
+            self._detach()
+        for name, column in self._ints.items():
+            value = getattr(item, name)
+            column.append(MISSING if value is None else int(value))
+        for name, (data, offsets) in self._strs.items():
+            value = getattr(item, name)
+            if value:
+                data += value.encode()
+            offsets.append(len(data))
+        self._len += 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    async def drain(self, items) -> int:
+        count = 0
+        async for item in items:
+            self.append(item)
+            count += 1
+        return count
+
+    def clear(self):
+        self.__init__()
+
+    def column(self, name: str) -> array | list[str]:
+        if name in self._ints:
+            return self._ints[name]
+        data, offsets = self._strs[name]
+        return [data[offsets[i]:offsets[i + 1]].decode() for i in range(self._len)]
+
+    def to_numpy(self) -> dict:
+        import numpy
+        self._exported = True
+        columns = {name: numpy.frombuffer(column, dtype=numpy.int64) for name, column in self._ints.items()}
+        for name in self._strs:
+            columns[name] = numpy.array(self.column(name), dtype=object)
+        return columns
+
+    def to_arrow(self):
+        import pyarrow
+        import pyarrow.compute
+        self._exported = True
+        columns = {}
+        for name, column in self._ints.items():
+            values = pyarrow.Array.from_buffers(pyarrow.int64(), self._len, [None, pyarrow.py_buffer(column)])
+            if name in self.nullable and MISSING in column:
+                values = pyarrow.compute.if_else(pyarrow.compute.equal(values, MISSING), None, values)
+            columns[name] = values
+        for name, (data, offsets) in self._strs.items():
+            values = pyarrow.Array.from_buffers(pyarrow.large_string(), self._len, [None, pyarrow.py_buffer(offsets), pyarrow.py_buffer(data)])
+            if name in self.nullable:
+                values = pyarrow.compute.if_else(pyarrow.compute.equal(values, ""), None, values)
+            columns[name] = values
+        return pyarrow.table(columns)
+
+    def write_parquet(self, path: str, **kwargs):
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(self.to_arrow(), path, **kwargs)
+
+
+class TweetBatch(ColumnBatch):
+    int_fields = ("id", "like_count", "retweet_count", "reply_count", "quote_count", "bookmark_count", "views_count")
+    str_fields = ("card_id",)
+    nullable = ("like_count", "retweet_count", "reply_count", "quote_count", "bookmark_count", "views_count", "card_id")
+
+
+class UserBatch(ColumnBatch):
+    int_fields = ("id", "followers_count", "following_count")
+    str_fields = ("name", "username")
+
+
+class NDJSONSink:
+    def __init__(self, path: str, dumps: callable = None):
+        self.path = path
+        self.dumps = dumps or (lambda value: json.dumps(value, separators=(",", ":")))
+        self.count = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8") if path.endswith(".gz") else open(path, "w", encoding="utf-8")
+
+    def write(self, item):
+        if hasattr(item, "model_dump"):
+            row = item.model_dump()
+        else:
+            row = {name: getattr(item, name) for name in item.fields}
+        self._file.write(self.dumps(row))
+        self._file.write("\n")
+        self.count += 1
+
+    async def drain(self, items) -> int:
+        count = 0
+        async for item in items:
+            self.write(item)
+            count += 1
+        return count
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
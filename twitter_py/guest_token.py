@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+
+class GuestTokenManager:
+    def __init__(self, fetch: callable, max_age: float = 3 * 60 * 60, max_uses: int = None, refresh_ratio: float = 0.8):
+        self._fetch = fetch
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self.refresh_ratio = refresh_ratio
+        self.token = None
+        self.created_at = None
+        self.uses = 0
+        self._refresh_task = None
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at if self.token else 0
+
+    def _usage(self) -> float:
+        usage = self.age / self.max_age if self.max_age else 0
+        if self.max_uses:
+            usage = max(usage, self.uses / self.max_uses)
+        return usage
+
+    async def get(self) -> str:
+        if not self.token or self._usage() >= 1:
+            await self.refresh()
+        elif self._usage() >= self.refresh_ratio and self._refresh_task is None:
+            self._start_refresh().add_done_callback(self._discard_error)
+        self.uses += 1
+        return self.token
+
+    async def refresh(self, stale: str = None) -> str:
+        if stale is not None and self.token != stale:
+            return self.token
+        await asyncio.shield(self._refresh_task or self._start_refresh())
+        return self.token
+
+    def set(self, token: str):
+        self.token = token
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+    def invalidate(self):
+        self.token = None
+
+    def _start_refresh(self) -> asyncio.Task:
+        self._refresh_task = asyncio.ensure_future(self._refresh())
+        return self._refresh_task
+
+    async def _refresh(self):
+        try:
+            self.set(await self._fetch())
+        finally:
+            self._refresh_task = None
+
+    @staticmethod
+    def _discard_error(task: asyncio.Task):
+        if not task.cancelled():
+            task.exception()
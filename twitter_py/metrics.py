@@ -0,0 +1,140 @@
+import bisect
+import collections
+import time
+
+import httpx
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+PARSE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+def operation_name(url: httpx.URL) -> str:
+    return url.path.rstrip("/").rsplit("/", 1)[-1]
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total = 0
+        buckets = []
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            buckets.append((str(bound), total))
+        return buckets
+
+    def snapshot(self) -> dict:
+        return {"count": self.count, "sum": self.sum, "buckets": dict(self.cumulative())}
+
+
+class Metrics:
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS, parse_buckets: tuple = PARSE_BUCKETS):
+        self.buckets = buckets
+        self.parse_buckets = parse_buckets
+        self.latency = {}
+        self.parse_time = {}
+        self.response_bytes = collections.Counter()
+        self.responses = collections.Counter()
+        self.errors = collections.Counter()
+        self.retries = collections.Counter()
+        self.cache_hits = collections.Counter()
+        self.cache_misses = collections.Counter()
+
+    @property
+    def event_hooks(self) -> dict:
+        return {"request": [self._on_request], "response": [self._on_response]}
+
+    async def _on_request(self, request: httpx.Request):
+        request.extensions["metrics_start"] = time.perf_counter()
+
+    async def _on_response(self, response: httpx.Response):
+        await response.aread()
+        request = response.request
+        name = operation_name(request.url)
+        start = request.extensions.get("metrics_start")
+        if start is not None:
+            self._histogram(self.latency, name, self.buckets).observe(time.perf_counter() - start)
+        self.response_bytes[name] += response.num_bytes_downloaded or len(response.content)
+        self.responses[name, response.status_code] += 1
+
+    @staticmethod
+    def _histogram(histograms: dict, name: str, buckets: tuple) -> Histogram:
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = Histogram(buckets)
+        return histogram
+
+    def observe_parse(self, name: str, seconds: float):
+        self._histogram(self.parse_time, name, self.parse_buckets).observe(seconds)
+
+    def record_error(self, name: str):
+        self.errors[name] += 1
+
+    def record_retry(self, name: str):
+        self.retries[name] += 1
+
+    def record_cache(self, name: str, hit: bool):
+        (self.cache_hits if hit else self.cache_misses)[name] += 1
+
+    def reset(self):
+        self.__init__(self.buckets, self.parse_buckets)
+
+    def snapshot(self) -> dict[str, dict]:
+        names = {*self.latency, *self.parse_time, *self.response_bytes, *self.errors, *self.retries, *self.cache_hits, *self.cache_misses}
+        names.update(name for name, _ in self.responses)
+        snapshot = {}
+        for name in sorted(names):
+            snapshot[name] = {
+                "requests": sum(count for (operation, _), count in self.responses.items() if operation == name),
+                "status": {status: count for (operation, status), count in self.responses.items() if operation == name},
+                "bytes": self.response_bytes[name],
+                "errors": self.errors[name],
+                "retries": self.retries[name],
+                "cache_hits": self.cache_hits[name],
+                "cache_misses": self.cache_misses[name],
+                "latency": self.latency[name].snapshot() if name in self.latency else None,
+                "parse_time": self.parse_time[name].snapshot() if name in self.parse_time else None
+            }
+        return snapshot
+
+    def render_prometheus(self, prefix: str = "twitter") -> str:
+        lines = []
+        for metric, help_text, histograms in (
+            ("request_duration_seconds", "Request latency including body download.", self.latency),
+            ("parse_duration_seconds", "Response JSON decode time.", self.parse_time)
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} histogram")
+            for name, histogram in sorted(histograms.items()):
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{prefix}_{metric}_bucket{{operation="{name}",le="{bound}"}} {count}')
+                lines.append(f'{prefix}_{metric}_sum{{operation="{name}"}} {histogram.sum}')
+                lines.append(f'{prefix}_{metric}_count{{operation="{name}"}} {histogram.count}')
+        lines.append(f"# HELP {prefix}_responses_total HTTP responses by status code.")
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for (name, status), count in sorted(self.responses.items()):
+            lines.append(f'{prefix}_responses_total{{operation="{name}",status="{status}"}} {count}')
+        for metric, help_text, counter in (
+            ("response_bytes_total", "Response bytes downloaded.", self.response_bytes),
+            ("errors_total", "Transport errors.", self.errors),
+            ("retries_total", "Retried requests.", self.retries),
+            ("cache_hits_total", "Response cache hits.", self.cache_hits),
+            ("cache_misses_total", "Response cache misses.", self.cache_misses)
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, count in sorted(counter.items()):
+                lines.append(f'{prefix}_{metric}{{operation="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field, AliasPath, AliasChoices
+from pydantic import BaseModel, Field, AliasPath, AliasChoices, TypeAdapter, ValidationError
+
+
+_REQUIRED = object()
 
 
 class User(BaseModel):
@@ -66,3 +69,57 @@ class Tweet(BaseModel):
             AliasPath("tweet", "views", "count")
         )
     )
+
+
+class LazyModel:
+    __slots__ = ("_result",)
+    model = None
+    fields = {}
+
+    def __init__(self, result: dict):
+        self._result = result
+
+    def __getattr__(self, name: str):
+        try:
+            paths, annotation, adapter, default = self.fields[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        value = default
+        for path in paths:
+            found = self._result
+            for key in path:
+                found = found.get(key) if type(found) is dict else None
+                if found is None:
+                    break
+            else:
+                value = found if type(found) is annotation else adapter.validate_python(found)
+                break
+        else:
+            if value is _REQUIRED:
+                raise ValidationError.from_exception_data(self.model.__name__, [{"type": "missing", "loc": (name,), "input": self._result}])
+        setattr(self, name, value)
+        return value
+
+    def materialize(self):
+        return self.model(**self._result)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+def lazy_view(model: type) -> type:
+    fields = {}
+    for name, field in model.model_fields.items():
+        alias = field.validation_alias
+        if isinstance(alias, AliasChoices):
+            paths = [choice.path if isinstance(choice, AliasPath) else [choice] for choice in alias.choices]
+        elif isinstance(alias, AliasPath):
+            paths = [alias.path]
+        else:
+            paths = [[alias or name]]
+        fields[name] = (paths, field.annotation, TypeAdapter(field.annotation), _REQUIRED if field.is_required() else field.get_default(call_default_factory=True))
+    return type(f"{model.__name__}View", (LazyModel,), {"__slots__": tuple(fields), "model": model, "fields": fields})
+
+
+UserView = lazy_view(User)
+TweetView = lazy_view(Tweet)
@@ -0,0 +1,281 @@
+import json
+from urllib.parse import quote
+
+
+PRIVATE_GRAPHQL_URL = "https://x.com/i/api/graphql"
+PUBLIC_GRAPHQL_URL = "https://api.twitter.com/graphql"
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class Operation:
+    def __init__(self, url: str, features: dict = None, field_toggles: dict = None, fetch_site: str = None):
+        self.url = url
+        self.query_id, self.name = url.rsplit("/", 2)[1:]
+        self.features = features
+        self.field_toggles = field_toggles
+        self.fetch_site = fetch_site or ("same-origin" if url.startswith("https://x.com/") else "same-site")
+        self.query = "".join(
+            f"&{key}={quote(_dumps(value), safe='')}"
+            for key, value in (("features", features), ("fieldToggles", field_toggles))
+            if value is not None
+        )
+        self._body_suffix = "".join(
+            f",\"{key}\":{_dumps(value)}"
+            for key, value in (("features", features), ("queryId", self.query_id))
+            if value is not None
+        ) + "}"
+
+    def encode_variables(self, variables: dict, dumps: callable = _dumps) -> str:
+        return quote(dumps(variables), safe="")
+
+    def build_url(self, encoded_variables: str) -> str:
+        return f"{self.url}?variables={encoded_variables}{self.query}"
+
+    def cache_key(self, encoded_variables: str, scope: str = "public") -> str:
+        return f"{scope}:{self.query_id}/{self.name}?{encoded_variables}"
+
+    def build_body(self, variables: dict, dumps: callable = _dumps) -> bytes:
+        return f"{{\"variables\":{dumps(variables)}{self._body_suffix}".encode()
+
+
+TIMELINE_FEATURES = {
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": True,
+    "tweet_awards_web_tipping_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "rweb_video_timestamps_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+USER_TWEETS_FEATURES = {
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "responsive_web_home_pinned_timelines_enabled": True,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": False,
+    "tweet_awards_web_tipping_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_media_download_video_enabled": False,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+TWEET_DETAIL_FEATURES = {
+    "rweb_lists_timeline_redesign_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": False,
+    "tweet_awards_web_tipping_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_media_download_video_enabled": False,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+USER_FEATURES = {
+    "hidden_profile_likes_enabled": True,
+    "hidden_profile_subscriptions_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "subscriptions_verification_info_is_identity_verified_enabled": True,
+    "subscriptions_verification_info_verified_since_enabled": True,
+    "highlights_tweets_tab_ui_enabled": True,
+    "responsive_web_twitter_article_notes_tab_enabled": True,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "responsive_web_graphql_timeline_navigation_enabled": True
+}
+
+SPACE_FEATURES = {
+    "spaces_2022_h2_spaces_communities": True,
+    "spaces_2022_h2_clipping": True,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": True,
+    "tweet_awards_web_tipping_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "rweb_video_timestamps_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+HOME_TIMELINE_FEATURES = {
+    "rweb_tipjar_consumption_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "creator_subscriptions_tweet_preview_api_enabled": True,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "communities_web_enable_tweet_community_results_fetch": True,
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "articles_preview_enabled": True,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": True,
+    "tweet_awards_web_tipping_enabled": False,
+    "creator_subscriptions_quote_tweet_preview_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "rweb_video_timestamps_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+CREATE_TWEET_FEATURES = {
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": False,
+    "tweet_awards_web_tipping_enabled": False,
+    "responsive_web_home_pinned_timelines_enabled": True,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "responsive_web_media_download_video_enabled": False,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+REPLY_FEATURES = {
+    "communities_web_enable_tweet_community_results_fetch": True,
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": True,
+    "tweet_awards_web_tipping_enabled": False,
+    "creator_subscriptions_quote_tweet_preview_enabled": False,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "articles_preview_enabled": True,
+    "rweb_video_timestamps_enabled": True,
+    "rweb_tipjar_consumption_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+QUOTE_FEATURES = {
+    "c9s_tweet_anatomy_moderator_badge_enabled": True,
+    "tweetypie_unmention_optimization_enabled": True,
+    "responsive_web_edit_tweet_api_enabled": True,
+    "graphql_is_translatable_rweb_tweet_is_translatable_enabled": True,
+    "view_counts_everywhere_api_enabled": True,
+    "longform_notetweets_consumption_enabled": True,
+    "responsive_web_twitter_article_tweet_consumption_enabled": True,
+    "tweet_awards_web_tipping_enabled": False,
+    "longform_notetweets_rich_text_read_enabled": True,
+    "longform_notetweets_inline_media_enabled": True,
+    "rweb_video_timestamps_enabled": True,
+    "responsive_web_graphql_exclude_directive_enabled": True,
+    "verified_phone_label_enabled": False,
+    "freedom_of_speech_not_reach_fetch_enabled": True,
+    "standardized_nudges_misinfo": True,
+    "tweet_with_visibility_results_prefer_gql_limited_actions_policy_enabled": True,
+    "responsive_web_graphql_skip_user_profile_image_extensions_enabled": False,
+    "responsive_web_graphql_timeline_navigation_enabled": True,
+    "responsive_web_enhance_cards_enabled": False
+}
+
+
+HOME_TIMELINE = Operation(f"{PRIVATE_GRAPHQL_URL}/A_qu1009UoeQToazaP4YCg/HomeTimeline", HOME_TIMELINE_FEATURES, fetch_site="same-site")
+AUDIO_SPACE_BY_ID = Operation(f"{PRIVATE_GRAPHQL_URL}/MZwo_AA10ZpJfbY4ZekqQA/AudioSpaceById", SPACE_FEATURES)
+TWEET_DETAIL = Operation(f"{PRIVATE_GRAPHQL_URL}/3XDB26fBve-MmjHaWTUZxA/TweetDetail", TWEET_DETAIL_FEATURES, {"withArticleRichContentState": False})
+FAVORITERS = Operation(f"{PRIVATE_GRAPHQL_URL}/3Y3356PTjeY9RfKYULEtng/Favoriters", TIMELINE_FEATURES)
+RETWEETERS = Operation(f"{PRIVATE_GRAPHQL_URL}/EvCvYif_Wh6UgW1nQunmLA/Retweeters", TIMELINE_FEATURES)
+SEARCH_TIMELINE = Operation(f"{PRIVATE_GRAPHQL_URL}/flaR-PUMshxFWZWPNpq4zA/SearchTimeline", TIMELINE_FEATURES)
+USER_BY_SCREEN_NAME = Operation(f"{PRIVATE_GRAPHQL_URL}/k5XapwcSikNsEsILW5FvgA/UserByScreenName", USER_FEATURES, {"withAuxiliaryUserLabels": False})
+USER_TWEETS = Operation(f"{PRIVATE_GRAPHQL_URL}/VgitpdpNZ-RUIp5D1Z_D-A/UserTweets", USER_TWEETS_FEATURES)
+FOLLOWERS = Operation(f"{PRIVATE_GRAPHQL_URL}/Uc7ZOJrxsJAzMVCcaxis8Q/Followers", TIMELINE_FEATURES)
+FOLLOWING = Operation(f"{PRIVATE_GRAPHQL_URL}/PiHWpObvX9tbClrUl6rL9g/Following", TIMELINE_FEATURES)
+USER_BY_REST_ID = Operation(f"{PRIVATE_GRAPHQL_URL}/tD8zKvQzwY3kdx5yz6YmOw/UserByRestId", USER_FEATURES)
+USERS_BY_REST_IDS = Operation(f"{PRIVATE_GRAPHQL_URL}/itEhGywpgX9b3GJCzOtSrA/UsersByRestIds", USER_FEATURES)
+USERS_BY_SCREEN_NAMES = Operation(f"{PRIVATE_GRAPHQL_URL}/yr1kKJnXTiXlx8zAbMXcJw/UsersByScreenNames", USER_FEATURES)
+
+AUDIO_SPACE_BY_ID_PUBLIC = Operation(f"{PRIVATE_GRAPHQL_URL}/MZwo_AA10ZpJfbY4ZekqQA/AudioSpaceById", SPACE_FEATURES)
+USER_BY_SCREEN_NAME_PUBLIC = Operation(f"{PUBLIC_GRAPHQL_URL}/k5XapwcSikNsEsILW5FvgA/UserByScreenName", USER_FEATURES, {"withAuxiliaryUserLabels": False})
+USER_TWEETS_PUBLIC = Operation(f"{PUBLIC_GRAPHQL_URL}/eS7LO5Jy3xgmd3dbL044EA/UserTweets", TIMELINE_FEATURES)
+USER_BY_REST_ID_PUBLIC = Operation(f"{PUBLIC_GRAPHQL_URL}/tD8zKvQzwY3kdx5yz6YmOw/UserByRestId", USER_FEATURES)
+USERS_BY_REST_IDS_PUBLIC = Operation(f"{PUBLIC_GRAPHQL_URL}/itEhGywpgX9b3GJCzOtSrA/UsersByRestIds", USER_FEATURES)
+USERS_BY_SCREEN_NAMES_PUBLIC = Operation(f"{PUBLIC_GRAPHQL_URL}/yr1kKJnXTiXlx8zAbMXcJw/UsersByScreenNames", USER_FEATURES)
+TWEET_RESULT_BY_REST_ID_PUBLIC = Operation(f"{PUBLIC_GRAPHQL_URL}/OUKdeWm3g4tDbW5hffX_QA/TweetResultByRestId", TIMELINE_FEATURES, {"withArticleRichContentState": False}, fetch_site="same-origin")
+
+FAVORITE_TWEET = Operation(f"{PRIVATE_GRAPHQL_URL}/lI07N6Otwv1PhnEgXILM7A/FavoriteTweet")
+CREATE_RETWEET = Operation(f"{PRIVATE_GRAPHQL_URL}/ojPdsZsimiJrUGLR1sjUtA/CreateRetweet")
+CREATE_BOOKMARK = Operation(f"{PRIVATE_GRAPHQL_URL}/aoDbu3RHznuiSkQ9aNM67Q/CreateBookmark")
+CREATE_TWEET = Operation(f"{PRIVATE_GRAPHQL_URL}/5V_dkq1jfalfiFOEZ4g47A/CreateTweet", CREATE_TWEET_FEATURES)
+CREATE_REPLY = Operation(f"{PRIVATE_GRAPHQL_URL}/oB-5XsHNAbjvARJEc8CZFw/CreateTweet", REPLY_FEATURES)
+CREATE_QUOTE = Operation(f"{PRIVATE_GRAPHQL_URL}/sgqau0P5BUJPMU_lgjpd_w/CreateTweet", QUOTE_FEATURES)
+DELETE_TWEET = Operation(f"{PRIVATE_GRAPHQL_URL}/VaenaVgh5q5ih7kvyVjgtg/DeleteTweet")
+DELETE_RETWEET = Operation(f"{PRIVATE_GRAPHQL_URL}/iQtK4dl5hBmXewYZuEOKVw/DeleteRetweet")
@@ -0,0 +1,160 @@
+import asyncio
+import heapq
+import time
+from array import array
+from typing import NamedTuple
+
+from twitter_py.exceptions import TweetNotFound
+
+
+METRICS = ("like_count", "retweet_count", "reply_count", "quote_count", "bookmark_count", "views_count")
+MISSING = -1
+
+
+class MetricsDelta(NamedTuple):
+    tweet_id: str
+    timestamp: float
+    values: tuple
+    changes: dict
+
+
+class TweetSeries:
+    __slots__ = ("capacity", "times", "values", "start", "count", "interval", "next_poll")
+
+    def __init__(self, capacity: int, interval: float):
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.values = array("q", bytes(8 * capacity * len(METRICS)))
+        self.start = 0
+        self.count = 0
+        self.interval = interval
+        self.next_poll = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, timestamp: float, values: tuple):
+        index = (self.start + self.count) % self.capacity
+        if self.count == self.capacity:
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.count += 1
+        self.times[index] = timestamp
+        offset = index * len(METRICS)
+        self.values[offset:offset + len(METRICS)] = array("q", values)
+
+    def latest(self) -> tuple | None:
+        if not self.count:
+            return None
+        offset = (self.start + self.count - 1) % self.capacity * len(METRICS)
+        return tuple(self.values[offset:offset + len(METRICS)])
+
+    def samples(self) -> list[tuple[float, tuple]]:
+        samples = []
+        for i in range(self.count):
+            index = (self.start + i) % self.capacity
+            offset = index * len(METRICS)
+            samples.append((self.times[index], tuple(self.values[offset:offset + len(METRICS)])))
+        return samples
+
+
+class EngagementPoller:
+    def __init__(self, twitter, min_interval: float = 60, max_interval: float = 3600, backoff: float = 2.0, capacity: int = 256, batch_size: int = 100, concurrency: int = 10, public: bool = True):
+        self.twitter = twitter
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.public = public
+        self._series = {}
+        self._schedule = []
+
+    def __len__(self):
+        return len(self._series)
+
+    def __contains__(self, tweet_id) -> bool:
+        return str(tweet_id) in self._series
+
+    def watch(self, tweet_id):
+        tweet_id = str(tweet_id)
+        if tweet_id in self._series:
+            return
+        series = TweetSeries(self.capacity, self.min_interval)
+        series.next_poll = time.monotonic()
+        self._series[tweet_id] = series
+        heapq.heappush(self._schedule, (series.next_poll, tweet_id))
+
+    def unwatch(self, tweet_id):
+        self._series.pop(str(tweet_id), None)
+
+    def series(self, tweet_id) -> TweetSeries:
+        return self._series[str(tweet_id)]
+
+    def next_due(self) -> float | None:
+        while self._schedule:
+            next_poll, tweet_id = self._schedule[0]
+            series = self._series.get(tweet_id)
+            if series is not None and series.next_poll == next_poll:
+                return next_poll
+            heapq.heappop(self._schedule)
+        return None
+
+    def _reschedule(self, tweet_id: str, series: TweetSeries, changed: bool):
+        if changed:
+            series.interval = max(self.min_interval, series.interval / self.backoff)
+        else:
+            series.interval = min(self.max_interval, series.interval * self.backoff)
+        series.next_poll = time.monotonic() + series.interval
+        heapq.heappush(self._schedule, (series.next_poll, tweet_id))
+
+    def _due(self) -> list[str]:
+        now = time.monotonic()
+        due = []
+        while len(due) < self.batch_size:
+            next_poll = self.next_due()
+            if next_poll is None or next_poll > now:
+                break
+            _, tweet_id = heapq.heappop(self._schedule)
+            due.append(tweet_id)
+        return due
+
+    async def poll_once(self) -> list[MetricsDelta]:
+        deltas = []
+        async for tweet_id, tweet in self.twitter.get_tweets_info(self._due(), self.concurrency, public=self.public, lazy=True):
+            series = self._series.get(tweet_id)
+            if series is None:
+                continue
+            if isinstance(tweet, TweetNotFound):
+                self.unwatch(tweet_id)
+                continue
+            if isinstance(tweet, Exception):
+                self._reschedule(tweet_id, series, False)
+                continue
+            values = tuple(MISSING if value is None else int(value) for value in (getattr(tweet, metric) for metric in METRICS))
+            previous = series.latest()
+            changed = previous != values
+            if changed:
+                timestamp = time.time()
+                series.append(timestamp, values)
+                previous = previous or (MISSING,) * len(METRICS)
+                changes = {
+                    metric: value if old == MISSING else value - old
+                    for metric, value, old in zip(METRICS, values, previous)
+                    if value != old and value != MISSING
+                }
+                deltas.append(MetricsDelta(tweet_id, timestamp, values, changes))
+            self._reschedule(tweet_id, series, changed)
+        return deltas
+
+    async def run(self):
+        while self._series:
+            next_poll = self.next_due()
+            if next_poll is None:
+                return
+            delay = next_poll - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            for delta in await self.poll_once():
+                yield delta
@@ -0,0 +1,33 @@
+import importlib.util
+
+import httpx
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self):
+        pass
+
+
+class ConnectionPool:
+    def __init__(self, http2: bool = True, max_connections: int = 100, max_keepalive_connections: int = 20, keepalive_expiry: float = 30, proxy: str = None, retries: int = 0):
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections, keepalive_expiry=keepalive_expiry)
+        self._transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits, proxy=f"http://{proxy}" if proxy else None, retries=retries)
+
+    def transport(self) -> SharedTransport:
+        return SharedTransport(self._transport)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+
+class RateLimitBucket:
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        if self.reset is not None and now >= self.reset:
+            self.remaining = self.limit
+            self.reset = None
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.time()
+                self._refill(now)
+                if self.remaining is None or self.remaining > 0:
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    return
+                await asyncio.sleep(self.reset - now if self.reset else 1)
+
+    def update(self, headers, status_code: int = 200):
+        try:
+            limit = int(headers["x-rate-limit-limit"])
+            remaining = int(headers["x-rate-limit-remaining"])
+            reset = int(headers["x-rate-limit-reset"])
+        except (KeyError, ValueError):
+            if status_code == 429:
+                self.remaining = 0
+                self.reset = time.time() + 60
+            return
+        if reset == self.reset and self.remaining is not None:
+            remaining = min(remaining, self.remaining)
+        if status_code == 429:
+            remaining = 0
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+
+    def budget(self) -> dict:
+        self._refill(time.time())
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset": self.reset
+        }
+
+
+class RateLimiter:
+    def __init__(self):
+        self._buckets = {}
+
+    def bucket(self, operation: str) -> RateLimitBucket:
+        bucket = self._buckets.get(operation)
+        if bucket is None:
+            bucket = self._buckets[operation] = RateLimitBucket()
+        return bucket
+
+    async def acquire(self, operation: str):
+        await self.bucket(operation).acquire()
+
+    def update(self, operation: str, headers, status_code: int = 200):
+        self.bucket(operation).update(headers, status_code)
+
+    def budget(self) -> dict[str, dict]:
+        return {operation: bucket.budget() for operation, bucket in self._buckets.items()}
@@ -0,0 +1,144 @@
+import asyncio
+import base64
+import collections
+import gzip
+import json
+import re
+import time
+from urllib.parse import parse_qsl
+
+import httpx
+
+from twitter_py.metrics import operation_name
+
+
+REDACTED_HEADERS = ("authorization", "cookie", "set-cookie", "x-csrf-token", "x-guest-token")
+DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+REDACTED = "<redacted>"
+_GUEST_TOKEN_PATTERN = re.compile(rb"gt=\d+")
+
+
+def request_variables(request: httpx.Request) -> dict | None:
+    variables = dict(parse_qsl(request.url.query.decode())).get("variables")
+    if variables is not None:
+        return json.loads(variables)
+    if request.content and request.headers.get("content-type", "").startswith("application/json"):
+        try:
+            return json.loads(request.content).get("variables")
+        except (ValueError, AttributeError):
+            return None
+    return None
+
+
+def _redact(headers: httpx.Headers) -> list[list[str]]:
+    return [[name, REDACTED if name.lower() in REDACTED_HEADERS else value] for name, value in headers.multi_items()]
+
+
+class FixtureWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.started_at = time.monotonic()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._users = 0
+
+    def acquire(self):
+        self._users += 1
+
+    def release(self):
+        self._users -= 1
+        if self._users <= 0:
+            self.close()
+
+    def write(self, record: dict):
+        if self._file is not None:
+            self._file.write(json.dumps(record, separators=(",", ":")))
+            self._file.write("\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, writer: FixtureWriter):
+        self.transport = transport
+        self.writer = writer
+        writer.acquire()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        offset = time.monotonic() - self.writer.started_at
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - start
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in DROPPED_HEADERS]
+        record = {
+            "operation": operation_name(request.url),
+            "method": request.method,
+            "url": str(request.url),
+            "variables": request_variables(request),
+            "request_headers": _redact(request.headers),
+            "status": response.status_code,
+            "headers": _redact(httpx.Headers(headers)),
+            "offset": offset,
+            "elapsed": elapsed
+        }
+        body = _GUEST_TOKEN_PATTERN.sub(b"gt=0", content)
+        try:
+            record["body"] = body.decode()
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(body).decode()
+        self.writer.write(record)
+        return httpx.Response(response.status_code, headers=headers, content=content, extensions=response.extensions)
+
+    async def aclose(self):
+        try:
+            await self.transport.aclose()
+        finally:
+            self.writer.release()
+
+
+def load_fixtures(path: str) -> list[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fixtures: str | list[dict], timing: bool = False):
+        self.records = load_fixtures(fixtures) if isinstance(fixtures, str) else fixtures
+        self.timing = timing
+        self.misses = 0
+        self._by_key = collections.defaultdict(list)
+        self._positions = collections.Counter()
+        for record in self.records:
+            self._by_key[self._key(record["method"], httpx.URL(record["url"]), record["variables"])].append(record)
+
+    @staticmethod
+    def _key(method: str, url: httpx.URL, variables: dict | None) -> tuple:
+        return method, url.host, url.path, json.dumps(variables, sort_keys=True)
+
+    def _next(self, key: tuple) -> dict | None:
+        records = self._by_key.get(key)
+        if not records:
+            return None
+        position = self._positions[key]
+        self._positions[key] = position + 1
+        return records[min(position, len(records) - 1)]
+
+    def rewind(self):
+        self._positions.clear()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        record = self._next(self._key(request.method, request.url, request_variables(request)))
+        if record is None:
+            self.misses += 1
+            return httpx.Response(404, json={"errors": [{"message": f"No recorded response for {operation_name(request.url)}"}]})
+        if self.timing:
+            await asyncio.sleep(record["elapsed"])
+        content = base64.b64decode(record["body_b64"]) if "body_b64" in record else record["body"].encode()
+        return httpx.Response(record["status"], headers=record["headers"], content=content)
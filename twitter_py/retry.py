@@ -0,0 +1,47 @@
+import random
+import time
+
+import httpx
+
+
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryPolicy:
+    def __init__(self, attempts: int = 4, backoff: float = 0.5, max_backoff: float = 30, max_wait: float = 900, budget: float = 20, budget_refill: float = 0.1, retry_mutations: bool = False):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self.budget = budget
+        self.budget_refill = budget_refill
+        self.retry_mutations = retry_mutations
+        self._tokens = budget
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self):
+        self._tokens = min(self.budget, self._tokens + self.budget_refill)
+
+    def spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def should_retry(self, attempt: int, error: Exception, idempotent: bool) -> bool:
+        if attempt >= self.attempts:
+            return False
+        if not (idempotent or self.retry_mutations or isinstance(error.__cause__, NOT_SENT_ERRORS)):
+            return False
+        if error.reset and error.reset - time.time() > self.max_wait:
+            return False
+        return self.spend()
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        if error.reset:
+            delay = max(delay, error.reset - time.time())
+        return delay
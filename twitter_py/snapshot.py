@@ -0,0 +1,126 @@
+import functools
+import mmap
+import struct
+import sys
+from array import array
+
+
+SNAPSHOT_MAGIC = b"TWIDSNAP"
+_HEADER = struct.Struct("<8sQ")
+
+
+@functools.cache
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _missing_from(numpy, ids, sorted_ids):
+    index = numpy.searchsorted(sorted_ids, ids)
+    found = index < len(sorted_ids)
+    found[found] = sorted_ids[index[found]] == ids[found]
+    return ids[~found]
+
+
+class IdSnapshot:
+    def __init__(self, ids: array | memoryview = None):
+        self.ids = ids if ids is not None else array("Q")
+        self._mmap = None
+
+    @classmethod
+    def from_ids(cls, ids) -> "IdSnapshot":
+        ids = ids if isinstance(ids, array) and ids.typecode == "Q" else array("Q", ids)
+        numpy = _numpy()
+        if numpy is not None:
+            return cls(array("Q", numpy.unique(numpy.frombuffer(ids, dtype=numpy.uint64)).tobytes()))
+        return cls(array("Q", sorted(set(ids))))
+
+    @classmethod
+    async def from_users(cls, users) -> "IdSnapshot":
+        ids = array("Q")
+        async for user in users:
+            ids.append(int(user.id))
+        return cls.from_ids(ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __contains__(self, user_id: int) -> bool:
+        ids = self.ids
+        low, high = 0, len(ids)
+        user_id = int(user_id)
+        while low < high:
+            middle = (low + high) // 2
+            if ids[middle] < user_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low < len(ids) and ids[low] == user_id
+
+    def save(self, path: str):
+        ids = self.ids if isinstance(self.ids, array) else array("Q", self.ids)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, len(ids)))
+            if sys.byteorder == "big":
+                ids = array("Q", ids)
+                ids.byteswap()
+            ids.tofile(f)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "IdSnapshot":
+        with open(path, "rb") as f:
+            magic, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not an id snapshot")
+            if use_mmap and count and sys.byteorder == "little":
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                snapshot = cls(memoryview(mapped)[_HEADER.size:_HEADER.size + count * 8].cast("Q"))
+                snapshot._mmap = mapped
+                return snapshot
+            ids = array("Q")
+            ids.fromfile(f, count)
+        if sys.byteorder == "big":
+            ids.byteswap()
+        return cls(ids)
+
+    def close(self):
+        if self._mmap is not None:
+            self.ids.release()
+            self._mmap.close()
+            self._mmap = None
+            self.ids = array("Q")
+
+    def diff(self, newer: "IdSnapshot") -> tuple["IdSnapshot", "IdSnapshot"]:
+        numpy = _numpy()
+        if numpy is not None:
+            old = numpy.frombuffer(self.ids, dtype=numpy.uint64)
+            new = numpy.frombuffer(newer.ids, dtype=numpy.uint64)
+            added = _missing_from(numpy, new, old)
+            removed = _missing_from(numpy, old, new)
+            return IdSnapshot(array("Q", added.tobytes())), IdSnapshot(array("Q", removed.tobytes()))
+        old, new = self.ids, newer.ids
+        added = array("Q")
+        removed = array("Q")
+        i = j = 0
+        old_len, new_len = len(old), len(new)
+        while i < old_len and j < new_len:
+            old_id = old[i]
+            new_id = new[j]
+            if old_id == new_id:
+                i += 1
+                j += 1
+            elif old_id < new_id:
+                removed.append(old_id)
+                i += 1
+            else:
+                added.append(new_id)
+                j += 1
+        removed.extend(old[i:])
+        added.extend(new[j:])
+        return IdSnapshot(added), IdSnapshot(removed)
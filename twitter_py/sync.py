@@ -0,0 +1,83 @@
+import asyncio
+import inspect
+import threading
+
+from twitter_py.twitter import Twitter
+
+
+class SyncTwitter:
+    def __init__(self, *args, timeout: float = None, **kwargs):
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="SyncTwitter", daemon=True)
+        self._thread.start()
+        self.twitter = self._call(self._create(args, kwargs))
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _create(args: tuple, kwargs: dict) -> Twitter:
+        return Twitter(*args, **kwargs)
+
+    def _call(self, coroutine):
+        if self._loop.is_closed():
+            coroutine.close()
+            raise RuntimeError("SyncTwitter is closed")
+        return asyncio.run_coroutine_threadsafe(asyncio.wait_for(coroutine, self.timeout), self._loop).result()
+
+    async def _getattr(self, name: str):
+        return getattr(self.twitter, name)
+
+    def _iterate(self, iterator):
+        try:
+            while True:
+                try:
+                    item = self._call(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            if hasattr(iterator, "aclose") and not self._loop.is_closed():
+                self._call(iterator.aclose())
+
+    def __getattr__(self, name: str):
+        attribute = self._call(self._getattr(name))
+        if not callable(attribute) or inspect.isclass(attribute):
+            return attribute
+
+        def method(*args, **kwargs):
+            result = attribute(*args, **kwargs)
+            if inspect.iscoroutine(result):
+                return self._call(result)
+            if hasattr(result, "__anext__"):
+                return self._iterate(result)
+            return result
+
+        method.__name__ = name
+        return method
+
+    async def _shutdown(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._loop.shutdown_asyncgens()
+        await self.twitter.__aexit__(None, None, None)
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,71 @@
+from typing import NamedTuple
+
+
+TWEET = "tweet"
+USER = "user"
+
+_RESULT_KEYS = (("tweet_results", TWEET), ("user_results", USER))
+_UNAVAILABLE = ("TweetTombstone", "TweetUnavailable", "UserUnavailable")
+
+
+class TimelineItem(NamedTuple):
+    kind: str
+    result: dict
+    entry_id: str
+    pinned: bool = False
+
+
+class TimelineCursor(NamedTuple):
+    cursor_type: str
+    value: str
+
+
+def _item(item_content: dict, entry_id: str, pinned: bool) -> TimelineItem | None:
+    if "promotedMetadata" in item_content:
+        return None
+    for key, kind in _RESULT_KEYS:
+        if key in item_content:
+            result = item_content[key].get("result")
+            break
+    else:
+        return None
+    if not result:
+        return None
+    typename = result.get("__typename")
+    if typename == "TweetWithVisibilityResults":
+        result = result["tweet"]
+    elif typename in _UNAVAILABLE:
+        return None
+    return TimelineItem(kind, result, entry_id, pinned)
+
+
+def _iter_entry(entry: dict, pinned: bool):
+    content = entry["content"]
+    entry_type = content.get("entryType") or content.get("__typename")
+    if entry_type == "TimelineTimelineItem":
+        item_content = content["itemContent"]
+        if item_content.get("itemType") == "TimelineTimelineCursor":
+            yield TimelineCursor(item_content["cursorType"], item_content["value"])
+        else:
+            item = _item(item_content, entry["entryId"], pinned)
+            if item:
+                yield item
+    elif entry_type == "TimelineTimelineModule":
+        for module_item in content.get("items", ()):
+            item = _item(module_item["item"]["itemContent"], module_item["entryId"], pinned)
+            if item:
+                yield item
+    elif entry_type == "TimelineTimelineCursor":
+        yield TimelineCursor(content["cursorType"], content["value"])
+
+
+def iter_timeline(instructions: list):
+    for instruction in instructions:
+        instruction_type = instruction["type"]
+        if instruction_type == "TimelineAddEntries":
+            for entry in instruction["entries"]:
+                yield from _iter_entry(entry, False)
+        elif instruction_type == "TimelinePinEntry":
+            yield from _iter_entry(instruction["entry"], True)
+        elif instruction_type == "TimelineReplaceEntry":
+            yield from _iter_entry(instruction["entry"], False)